@@ -8,41 +8,47 @@ appropriate handlers (Slack notifications, Zunda voice, event logging).
 import json
 import sys
 
-from src.core.dispatcher import EventDispatcher
-from src.utils.io_helpers import load_hook_event, write_hook_event
+from src.core.dispatcher import get_dispatcher
+from src.utils.io_helpers import (
+    parse_hook_event,
+    read_hook_input,
+    write_hook_event,
+    write_hook_input,
+)
 from src.utils.logger import get_debug_logger
 
 
 def main() -> None:
     """Main entry point for all hooks handler"""
     debug_logger = get_debug_logger()
+    raw_input = None
 
     try:
         # イベントデータを読み込み
-        event = load_hook_event(sys.stdin)
+        raw_input = read_hook_input(sys.stdin)
+        event = parse_hook_event(raw_input)
 
-        debug_logger.info(f"Processing hook event: {event.hook_event_name}")
+        debug_logger.info("Processing hook event: %s", event.hook_event_name)
 
         # ディスパッチャーで適切なハンドラーに振り分け
-        dispatcher = EventDispatcher()
-        dispatcher.dispatch(event)
+        get_dispatcher().dispatch(event)
 
         # 元のイベントデータを出力（透過性を保つ）
         write_hook_event(event, sys.stdout)
 
     except json.JSONDecodeError as e:
-        debug_logger.error(f"Invalid JSON input: {e}")
+        debug_logger.error("Invalid JSON input: %s", e)
         # エラーでも空のJSONを出力して処理を続行
         print(json.dumps({}))
         sys.exit(1)
 
     except Exception as e:
-        debug_logger.error(f"Unexpected error in hook handler: {e}", exc_info=True)
+        debug_logger.error("Unexpected error in hook handler: %s", e, exc_info=True)
         # エラーでも元のデータを出力して処理を続行
         try:
-            # 可能な限り元のデータを出力
-            if "event" in locals():
-                write_hook_event(event, sys.stdout)
+            # 可能な限り元のデータをそのまま出力
+            if raw_input is not None:
+                write_hook_input(raw_input, sys.stdout)
             else:
                 print(json.dumps({}))
         except Exception:
@@ -12,8 +12,9 @@ from pathlib import Path
 
 def main():
     # Hookデータを標準入力から読み込み
+    # Read the raw bytes in one call; json.loads decodes UTF-8 itself
     try:
-        hook_data = json.load(sys.stdin)
+        hook_data = json.loads(sys.stdin.buffer.read())
     except json.JSONDecodeError:
         # JSONパースエラーは無視（別のhookの可能性）
         sys.exit(0)
@@ -46,7 +47,8 @@ def main():
         sys.exit(0)
 
     # ファイルが存在するか確認
-    if not Path(file_path).exists():
+    path = Path(file_path)
+    if not path.exists():
         sys.exit(0)
 
     # ruff formatを実行
@@ -58,7 +60,7 @@ def main():
 
         # 成功した場合はメッセージを出力
         if result.returncode == 0:
-            print(f"✨ Formatted {Path(file_path).name} with ruff", file=sys.stderr)
+            print(f"✨ Formatted {path.name} with ruff", file=sys.stderr)
         else:
             # エラーがあれば出力
             if result.stderr:
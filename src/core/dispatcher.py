@@ -1,7 +1,8 @@
 """Event dispatcher for Claude Code Hooks"""
 
-import os
+import functools
 
+from ..utils.config import get_bool_env
 from .base import HookHandler
 from .types import HookEvent
 
@@ -15,7 +16,7 @@ class EventDispatcher:
 
     def _init_zunda(self) -> HookHandler | None:
         """Initialize Zunda speaker if enabled"""
-        if os.getenv("CCHH_ZUNDA_SPEAKER_ENABLED", "true").lower() == "true":
+        if get_bool_env("CCHH_ZUNDA_SPEAKER_ENABLED", True):
             try:
                 from ..zunda.speaker import ZundaSpeaker
 
@@ -27,7 +28,7 @@ class EventDispatcher:
 
     def _init_logger(self) -> HookHandler | None:
         """Initialize event logger if enabled"""
-        if os.getenv("CCHH_EVENT_LOGGING_ENABLED", "true").lower() == "true":
+        if get_bool_env("CCHH_EVENT_LOGGING_ENABLED", True):
             try:
                 from ..logger.event_logger import EventLogger
 
@@ -51,3 +52,14 @@ class EventDispatcher:
                 self.logger.handle_event(event)
             except Exception as e:
                 print(f"Logger handler error: {e}")
+
+
+# Global instance
+@functools.cache
+def get_dispatcher() -> EventDispatcher:
+    """Get global event dispatcher instance
+
+    Handlers are session-agnostic, so one set is built per process and reused
+    for every event dispatched through it.
+    """
+    return EventDispatcher()
@@ -1,12 +1,16 @@
 """Core type definitions for Claude Code Hooks"""
 
-from dataclasses import dataclass
-from enum import Enum
+from dataclasses import dataclass, field
+from enum import StrEnum
 from typing import Any, NotRequired, TypedDict
 
 
-class HookEventName(Enum):
-    """Enumeration of available hook event names"""
+class HookEventName(StrEnum):
+    """Enumeration of available hook event names
+
+    Members are str instances equal to their value, so they can be used
+    wherever the raw event name string is expected.
+    """
 
     PRE_TOOL_USE = "PreToolUse"
     POST_TOOL_USE = "PostToolUse"
@@ -16,6 +20,12 @@ class HookEventName(Enum):
     PRE_COMPACT = "PreCompact"
 
 
+# Event name string -> enum member, looked up once per event in from_dict
+_EVENT_BY_VALUE: dict[str, HookEventName] = {
+    member.value: member for member in HookEventName
+}
+
+
 # Claude Code Hook Input Schemas
 # These TypedDicts define the exact structure of events sent by Claude Code
 # Based on https://docs.anthropic.com/en/docs/claude-code/hooks#hook-input
@@ -64,10 +74,20 @@ class PreCompactInput(BaseHookInput):
 HookInput = PreToolUseInput | PostToolUseInput | NotificationInput | StopInput | UserPromptSubmitInput | PreCompactInput
 
 
-@dataclass
+@dataclass(slots=True)
 class HookEvent:
     """Represents a Claude Code hook event"""
 
+    # Optional fields copied into to_dict() output when set, in output order
+    _OPTIONAL_FIELDS = (
+        "tool_name",
+        "tool_input",
+        "tool_response",
+        "notification",
+        "output",
+        "result",
+    )
+
     hook_event_name: str | HookEventName
     session_id: str
     cwd: str
@@ -79,21 +99,16 @@ class HookEvent:
     notification: str | None = None
     output: str | None = None
     raw_data: dict[str, Any] | None = None
+    # Original JSON payload as received, echoed back verbatim on passthrough
+    raw_json: bytes | str | None = field(default=None, repr=False)
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "HookEvent":
         """Create HookEvent from dictionary"""
-        # Try to convert event name to enum if possible
+        # Convert event name to enum if possible, otherwise keep as is
         event_name = data.get("hook_event_name", "Unknown")
-        try:
-            # Try to find matching enum value
-            for enum_member in HookEventName:
-                if enum_member.value == event_name:
-                    event_name = enum_member
-                    break
-        except Exception:
-            # Keep as string if conversion fails
-            pass
+        if isinstance(event_name, str):
+            event_name = _EVENT_BY_VALUE.get(event_name, event_name)
 
         return cls(
             hook_event_name=event_name,
@@ -116,30 +131,21 @@ class HookEvent:
         We need to return the flattened data, not the raw nested structure.
         """
         # Build flat structure from fields
-        # Handle both string and enum for hook_event_name
-        event_name = self.hook_event_name
-        if isinstance(event_name, HookEventName):
-            event_name = event_name.value
-
+        # hook_event_name is a str either way (HookEventName is a StrEnum)
         result: dict[str, Any] = {
-            "hook_event_name": event_name,
+            "hook_event_name": self.hook_event_name,
             "session_id": self.session_id,
             "cwd": self.cwd,
         }
 
         # Add optional fields if present
-        if self.tool_name:
-            result["tool_name"] = self.tool_name
-        if self.tool_input:
-            result["tool_input"] = self.tool_input
-        if self.tool_response:
-            result["tool_response"] = self.tool_response
-        if self.notification:
-            result["notification"] = self.notification
-        if self.output:
-            result["output"] = self.output
-        if self.result:
-            result["result"] = self.result
+        result.update(
+            {
+                name: value
+                for name in self._OPTIONAL_FIELDS
+                if (value := getattr(self, name))
+            }
+        )
 
         # Preserve any additional fields from raw_data that aren't standard
         if self.raw_data:
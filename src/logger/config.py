@@ -1,7 +1,8 @@
 """Event logger configuration"""
 
 import os
-from pathlib import Path
+
+from ..utils.config import get_bool_env, get_home_dir
 
 
 class LoggerConfig:
@@ -12,8 +13,8 @@ class LoggerConfig:
         self.enabled = self._get_bool_env("CCHH_EVENT_LOGGING_ENABLED", True)
 
         # Log file locations
-        self.log_dir = Path.home() / ".cchh" / "logs"
-        self.log_dir.mkdir(parents=True, exist_ok=True)
+        # Created lazily by the writer on first use
+        self.log_dir = get_home_dir() / ".cchh" / "logs"
 
         self.event_log_file = self.log_dir / "events.jsonl"
         self.max_log_size = (
@@ -23,8 +24,7 @@ class LoggerConfig:
 
     def _get_bool_env(self, key: str, default: bool) -> bool:
         """Get boolean value from environment variable"""
-        value = os.environ.get(key, str(default)).lower()
-        return value in ("1", "true", "yes")
+        return get_bool_env(key, default)
 
 
 # Global instance
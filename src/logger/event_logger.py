@@ -1,15 +1,49 @@
 """Event logger for Claude Code Hooks"""
 
 import json
-from datetime import datetime
+import os
+import threading
+from collections.abc import Iterator
 from pathlib import Path
+from typing import BinaryIO
 
 from ..core.base import BaseHandler
 from ..core.types import HookEvent
 from ..utils.config import is_test_environment
-from ..utils.logger import get_debug_logger
+from ..utils.logger import get_debug_logger, utc_timestamp
 from .config import logger_config
 
+# json.dumps builds a new encoder whenever non-default options are passed
+_JSON_ENCODER = json.JSONEncoder(ensure_ascii=False)
+
+
+def _iter_lines_reversed(file: BinaryIO, chunk_size: int = 8192) -> Iterator[bytes]:
+    """Yield the lines of a binary file from last to first
+
+    The file is read backwards in fixed-size chunks, so callers that stop
+    early only touch the tail of the file.
+    """
+    position = file.seek(0, os.SEEK_END)
+    # Pieces of the line currently being assembled, last piece first
+    pieces: list[bytes] = []
+    while position > 0:
+        read_size = min(chunk_size, position)
+        position -= read_size
+        file.seek(position)
+        chunk = file.read(read_size)
+        if b"\n" not in chunk:
+            # Still inside one long line; join only once its start is found
+            pieces.append(chunk)
+            continue
+
+        parts = chunk.split(b"\n")
+        pieces.append(parts[-1])
+        yield b"".join(reversed(pieces))
+        yield from reversed(parts[1:-1])
+        # The first part may continue in the preceding chunk
+        pieces = [parts[0]]
+    yield b"".join(reversed(pieces))
+
 
 class EventLogger(BaseHandler):
     """Logs all hook events to JSONL file"""
@@ -18,10 +52,10 @@ class EventLogger(BaseHandler):
         self.enabled = logger_config.enabled
         self.log_file = log_file or logger_config.event_log_file
         self.debug_logger = get_debug_logger()
-
-        # Ensure log directory exists
-        if self.enabled:
-            self.log_file.parent.mkdir(parents=True, exist_ok=True)
+        self._log_fd: int | None = None
+        # Size of the open log file, tracked in-process for rotation checks
+        self._log_size = 0
+        self._lock = threading.Lock()
 
     def handle_event(self, event: HookEvent) -> None:
         """Handle incoming hook event"""
@@ -36,32 +70,80 @@ class EventLogger(BaseHandler):
 
     def _log_event(self, event: HookEvent) -> None:
         """Log event to file"""
-        # Create log entry with time and raw_input
-        log_entry = {
-            "time": datetime.now().isoformat() + "Z",
-            "raw_input": event.to_dict(),
-        }
+        # Create log entry with time and raw_input (the flattened event)
+        timestamp = utc_timestamp()
+        line = (
+            '{"time": "'
+            + timestamp
+            + '", "raw_input": '
+            + self._serialize_raw_input(event)
+            + "}\n"
+        ).encode()
 
         try:
-            with open(self.log_file, "a", encoding="utf-8") as f:
-                f.write(json.dumps(log_entry, ensure_ascii=False) + "\n")
+            with self._lock:
+                fd = self._get_log_fd()
+                # One write per entry; O_APPEND keeps entries from concurrent
+                # hook processes from interleaving
+                self._log_size += len(line)
+                while line:
+                    line = line[os.write(fd, line) :]
         except Exception as e:
-            self.debug_logger.error(f"Failed to write log entry: {e}")
+            self.debug_logger.error("Failed to write log entry: %s", e)
+
+    def _serialize_raw_input(self, event: HookEvent) -> str:
+        """Return event.to_dict() as a single-line JSON document
+
+        When the flattened event equals the payload as received (the common
+        case), the received JSON text is reused instead of re-encoding it.
+        """
+        entry = event.to_dict()
+        raw_json = event.raw_json
+        if raw_json is None or entry != event.raw_data:
+            return _JSON_ENCODER.encode(entry)
+
+        if isinstance(raw_json, bytes):
+            try:
+                raw_json = raw_json.decode("utf-8-sig")
+            except UnicodeDecodeError:
+                return _JSON_ENCODER.encode(entry)
+
+        # Line breaks cannot appear inside JSON strings, so any here are
+        # whitespace between tokens; flatten them to keep one entry per line
+        return raw_json.strip().replace("\n", " ").replace("\r", " ")
+
+    def _get_log_fd(self) -> int:
+        """Open the log file on first use and reuse the descriptor afterwards"""
+        if self._log_fd is None:
+            self.log_file.parent.mkdir(parents=True, exist_ok=True)
+            self._log_fd = os.open(
+                self.log_file, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644
+            )
+            self._log_size = os.fstat(self._log_fd).st_size
+        return self._log_fd
+
+    def close(self) -> None:
+        """Close the cached log file descriptor"""
+        with self._lock:
+            if self._log_fd is not None:
+                os.close(self._log_fd)
+                self._log_fd = None
+                self._log_size = 0
 
     def _check_rotation(self) -> None:
-        """Check if log rotation is needed"""
-        try:
-            if not self.log_file.exists():
-                return
+        """Check if log rotation is needed
 
-            file_size = self.log_file.stat().st_size
-            if file_size > logger_config.max_log_size:
-                self._rotate_logs()
-        except Exception as e:
-            self.debug_logger.error(f"Error checking log rotation: {e}")
+        The size comes from fstat when the file is opened plus the bytes
+        written since, so no stat call is made per event.
+        """
+        if self._log_size > logger_config.max_log_size:
+            self._rotate_logs()
 
     def _rotate_logs(self) -> None:
         """Rotate log files"""
+        # The cached descriptor would keep appending to the renamed file
+        self.close()
+
         try:
             # Remove oldest log if at max count
             oldest = (
@@ -83,7 +165,7 @@ class EventLogger(BaseHandler):
 
             self.debug_logger.info("Log files rotated successfully")
         except Exception as e:
-            self.debug_logger.error(f"Error rotating logs: {e}")
+            self.debug_logger.error("Error rotating logs: %s", e)
 
     def get_recent_events(
         self, count: int = 100, session_id: str | None = None
@@ -97,15 +179,11 @@ class EventLogger(BaseHandler):
         Returns:
             List of recent events
         """
-        if not self.log_file.exists():
-            return []
-
         events = []
         try:
-            with open(self.log_file, encoding="utf-8") as f:
-                # Read from end of file for efficiency
-                lines = f.readlines()
-                for line in reversed(lines):
+            with open(self.log_file, "rb") as f:
+                # Read from end of file, stopping once enough events are found
+                for line in _iter_lines_reversed(f):
                     if not line.strip():
                         continue
 
@@ -117,9 +195,12 @@ class EventLogger(BaseHandler):
                         events.append(event)
                         if len(events) >= count:
                             break
-                    except json.JSONDecodeError:
+                    except ValueError:
+                        # Malformed JSON or invalid UTF-8
                         continue
+        except FileNotFoundError:
+            return []
         except Exception as e:
-            self.debug_logger.error(f"Error reading events: {e}")
+            self.debug_logger.error("Error reading events: %s", e)
 
         return list(reversed(events))
@@ -1,8 +1,23 @@
 """Command parsing utilities"""
 
+import re
 import shlex
 from typing import Any
 
+# Without quotes or escapes, shlex tokenizes exactly like splitting on its
+# whitespace characters, so such commands can skip the lexer
+_SHLEX_SPECIAL = re.compile(r"[\"'\\]")
+_SHLEX_TOKEN = re.compile(r"[^ \t\r\n]+")
+# Pipes and redirections; ">>" and "<<" are covered by their first character
+_PIPELINE_OPERATOR = re.compile(r"[|<>]")
+
+# Command names by category, for get_command_category
+GIT_COMMANDS = frozenset({"git", "gh"})
+PACKAGE_MANAGER_COMMANDS = frozenset({"npm", "yarn", "pnpm", "pip", "poetry", "uv"})
+CONTAINER_COMMANDS = frozenset({"docker", "docker-compose", "kubectl", "helm"})
+FILE_COMMANDS = frozenset({"cp", "mv", "rm", "mkdir", "touch", "chmod", "chown"})
+SYSTEM_COMMANDS = frozenset({"sudo", "systemctl", "service", "ps", "kill"})
+
 
 def parse_bash_command(command: str) -> dict[str, Any]:
     """Parse bash command into structured format
@@ -29,8 +44,11 @@ def parse_bash_command(command: str) -> dict[str, Any]:
         return result
 
     try:
-        # Use shlex to properly parse the command
-        parts = shlex.split(command)
+        # Use shlex to properly parse quoted commands
+        if _SHLEX_SPECIAL.search(command):
+            parts = shlex.split(command)
+        else:
+            parts = _SHLEX_TOKEN.findall(command)
         if not parts:
             return result
 
@@ -76,6 +94,16 @@ def extract_command_name(command: str) -> str:
     Returns:
         Command name only
     """
+    # Same guard as parse_bash_command: str.strip() also covers whitespace
+    # that shlex does not split on (e.g. \u3000, \x0b)
+    if not command.strip():
+        return ""
+
+    # Only the first token is needed; unquoted commands skip the full parse
+    if not _SHLEX_SPECIAL.search(command):
+        match = _SHLEX_TOKEN.search(command)
+        return match.group() if match else ""
+
     parsed = parse_bash_command(command)
     return parsed["command"]
 
@@ -89,7 +117,7 @@ def is_pipeline_command(command: str) -> bool:
     Returns:
         True if command contains pipes or redirections
     """
-    return any(op in command for op in ["|", ">", "<", ">>", "<<"])
+    return _PIPELINE_OPERATOR.search(command) is not None
 
 
 def split_pipeline(command: str) -> list[str]:
@@ -119,23 +147,23 @@ def get_command_category(command: str) -> str:
     cmd_name = extract_command_name(command).lower()
 
     # Git commands
-    if cmd_name in ["git", "gh"]:
+    if cmd_name in GIT_COMMANDS:
         return "git"
 
     # Package managers
-    if cmd_name in ["npm", "yarn", "pnpm", "pip", "poetry", "uv"]:
+    if cmd_name in PACKAGE_MANAGER_COMMANDS:
         return "npm"
 
     # Container/orchestration
-    if cmd_name in ["docker", "docker-compose", "kubectl", "helm"]:
+    if cmd_name in CONTAINER_COMMANDS:
         return "docker"
 
     # File operations
-    if cmd_name in ["cp", "mv", "rm", "mkdir", "touch", "chmod", "chown"]:
+    if cmd_name in FILE_COMMANDS:
         return "file"
 
     # System commands
-    if cmd_name in ["sudo", "systemctl", "service", "ps", "kill"]:
+    if cmd_name in SYSTEM_COMMANDS:
         return "system"
 
     return "other"
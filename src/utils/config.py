@@ -1,17 +1,37 @@
 """Global configuration utilities"""
 
+import functools
 import os
 from pathlib import Path
 
 
+def get_bool_env(key: str, default: bool) -> bool:
+    """Get boolean value from environment variable ("1", "true" or "yes")"""
+    value = os.environ.get(key)
+    if value is None:
+        return default
+    return value.lower() in ("1", "true", "yes")
+
+
+@functools.cache
 def is_test_environment() -> bool:
-    """Check if running in test environment"""
+    """Check if running in test environment
+
+    The environment is read once per process; call
+    is_test_environment.cache_clear() after changing CCHH_TEST_ENVIRONMENT.
+    """
     return os.environ.get("CCHH_TEST_ENVIRONMENT", "").lower() in ("1", "true", "yes")
 
 
+@functools.cache
+def get_home_dir() -> Path:
+    """Get the user's home directory, resolved once per process"""
+    return Path.home()
+
+
 def get_cchh_home() -> Path:
     """Get CCHH home directory"""
-    home = Path.home() / ".cchh"
+    home = get_home_dir() / ".cchh"
     home.mkdir(parents=True, exist_ok=True)
     return home
 
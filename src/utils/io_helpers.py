@@ -1,12 +1,32 @@
 """I/O helper functions"""
 
 import json
+import os
+import stat
 import sys
 from typing import Any, TextIO
 
 from ..core.types import HookEvent
 
 
+def read_hook_input(stream: TextIO | None = None) -> bytes | str:
+    """Read the raw hook payload from the input stream
+
+    Args:
+        stream: Input stream (defaults to sys.stdin)
+
+    Returns:
+        Raw payload as bytes when the stream has a binary buffer, else str
+    """
+    if stream is None:
+        stream = sys.stdin
+
+    # Read bytes from the underlying buffer when available; json.loads decodes
+    # UTF-8 itself, so the text layer's incremental decoding is skipped
+    buffer = getattr(stream, "buffer", None)
+    return buffer.read() if buffer is not None else stream.read()
+
+
 def load_hook_event(stream: TextIO | None = None) -> HookEvent:
     """Load hook event from JSON input stream
 
@@ -20,11 +40,24 @@ def load_hook_event(stream: TextIO | None = None) -> HookEvent:
         json.JSONDecodeError: If input is not valid JSON
         ValueError: If required fields are missing
     """
-    if stream is None:
-        stream = sys.stdin
+    return parse_hook_event(read_hook_input(stream))
+
+
+def parse_hook_event(raw_input: bytes | str) -> HookEvent:
+    """Parse hook event from a raw JSON payload
+
+    Args:
+        raw_input: Payload as returned by read_hook_input
+
+    Returns:
+        HookEvent object
 
+    Raises:
+        json.JSONDecodeError: If input is not valid JSON
+        ValueError: If required fields are missing
+    """
     try:
-        raw_data = json.loads(stream.read())
+        raw_data = json.loads(raw_input)
     except json.JSONDecodeError as e:
         raise json.JSONDecodeError(f"Invalid JSON input: {e.msg}", e.doc, e.pos) from e
 
@@ -36,17 +69,18 @@ def load_hook_event(stream: TextIO | None = None) -> HookEvent:
         raise ValueError("Missing required field: hook_event_name")
 
     # Set defaults for commonly missing fields
-    if "session_id" not in data:
-        data["session_id"] = "unknown"
-    if "cwd" not in data:
-        import os
-
-        data["cwd"] = os.getcwd()
+    # (copy first: data may still be the original raw_data)
+    if "session_id" not in data or "cwd" not in data:
+        data = data.copy()
+        data.setdefault("session_id", "unknown")
+        if "cwd" not in data:
+            data["cwd"] = os.getcwd()
 
     # Create HookEvent with normalized data but preserve original raw_data
     event = HookEvent.from_dict(data)
     # Override raw_data with the original nested structure
     event.raw_data = raw_data
+    event.raw_json = raw_input
     return event
 
 
@@ -62,27 +96,27 @@ def _normalize_hook_event_data(raw_data: dict[str, Any]) -> dict[str, Any]:
         raw_data: Raw event data from Claude Code
 
     Returns:
-        Normalized event data
+        Normalized event data; raw_data itself when nothing needs changing
     """
-    # Copy the data
-    data = raw_data.copy()
-
     # Special handling for Notification events
     # Claude Code sends 'message' but CCH expects 'notification'
     if (
-        data.get("hook_event_name") == "Notification"
-        and "message" in data
-        and "notification" not in data
+        raw_data.get("hook_event_name") == "Notification"
+        and "message" in raw_data
+        and "notification" not in raw_data
     ):
-        # Map message to notification field
-        data["notification"] = data["message"]
+        # Map message to notification field on a copy
+        return {**raw_data, "notification": raw_data["message"]}
 
-    return data
+    return raw_data
 
 
 def write_hook_event(event: HookEvent, stream: TextIO | None = None) -> None:
     """Write hook event to output stream
 
+    Events loaded with load_hook_event are written back exactly as they were
+    received; other events are serialized from their fields.
+
     Args:
         event: HookEvent to write
         stream: Output stream (defaults to sys.stdout)
@@ -90,7 +124,35 @@ def write_hook_event(event: HookEvent, stream: TextIO | None = None) -> None:
     if stream is None:
         stream = sys.stdout
 
-    json.dump(event.to_dict(), stream)
+    if event.raw_json is None:
+        # json.dumps uses the C encoder in one shot; json.dump would stream
+        # pure-Python chunks into many small writes
+        stream.write(json.dumps(event.to_dict()))
+        stream.flush()
+    else:
+        write_hook_input(event.raw_json, stream)
+
+
+def write_hook_input(raw_input: bytes | str, stream: TextIO | None = None) -> None:
+    """Write a raw hook payload back to the output stream unchanged
+
+    Args:
+        raw_input: Payload as returned by read_hook_input
+        stream: Output stream (defaults to sys.stdout)
+    """
+    if stream is None:
+        stream = sys.stdout
+
+    if isinstance(raw_input, str):
+        stream.write(raw_input)
+    else:
+        # Echo the original bytes without a parse/serialize round-trip
+        buffer = getattr(stream, "buffer", None)
+        if buffer is not None:
+            stream.flush()
+            buffer.write(raw_input)
+        else:
+            stream.write(raw_input.decode("utf-8"))
     stream.flush()
 
 
@@ -119,8 +181,27 @@ def save_json_file(data: dict[str, Any], file_path: str, indent: int = 2) -> Non
         file_path: Path to save to
         indent: JSON indentation level
     """
-    with open(file_path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=indent, ensure_ascii=False)
+    # Serialize up front with the C encoder and write it in one call
+    payload = json.dumps(data, indent=indent, ensure_ascii=False).encode("utf-8")
+
+    # Write to a sibling temp file and rename it into place, so readers never
+    # see a partially written file. The temp file is created with the
+    # target's mode (0666 for a new file) and the kernel applies the umask,
+    # as a plain open() would.
+    try:
+        mode = stat.S_IMODE(os.stat(file_path).st_mode)
+    except FileNotFoundError:
+        mode = 0o666
+    directory, name = os.path.split(os.path.abspath(file_path))
+    tmp_path = os.path.join(directory, f".{name}.{os.urandom(4).hex()}.tmp")
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, mode)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(payload)
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
 
 
 def append_jsonl(data: dict[str, Any], file_path: str) -> None:
@@ -1,20 +1,45 @@
 """Logging utilities for error tracking and debugging"""
 
+import functools
 import json
 import logging
+import os
 import sys
+import threading
+import time
 import traceback
-from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, TextIO
+
+from .config import get_home_dir
+
+# (epoch second, formatted "YYYY-MM-DDTHH:MM:SS") of the last timestamp
+_timestamp_prefix: tuple[int, str] = (-1, "")
+
+
+def utc_timestamp() -> str:
+    """Return the current UTC time in ISO 8601 format with a Z suffix
+
+    The date and time-of-day part is formatted once per second; only the
+    microseconds are formatted on every call.
+    """
+    global _timestamp_prefix
+    now = time.time()
+    seconds = int(now)
+    cached_seconds, prefix = _timestamp_prefix
+    if seconds != cached_seconds:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(seconds))
+        _timestamp_prefix = (seconds, prefix)
+    return f"{prefix}.{int((now - seconds) * 1_000_000):06d}Z"
 
 
 class ErrorLogger:
     """Handles error logging to file"""
 
     def __init__(self, log_file: Path | None = None):
-        self.log_file = log_file or Path.home() / ".cchh" / "errors.log"
-        self.log_file.parent.mkdir(parents=True, exist_ok=True)
+        self.log_file = log_file or get_home_dir() / ".cchh" / "errors.log"
+        self._log_handle: TextIO | None = None
+        self._lock = threading.Lock()
 
     def log_error(
         self,
@@ -25,7 +50,7 @@ class ErrorLogger:
     ) -> None:
         """Log error to file with context"""
         error_entry = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": utc_timestamp(),
             "error_type": error_type,
             "error_message": error_message,
             "context": context or {},
@@ -36,20 +61,38 @@ class ErrorLogger:
                 type(exception), exception, exception.__traceback__
             )
 
+        line = json.dumps(error_entry, ensure_ascii=False) + "\n"
+
         try:
-            with open(self.log_file, "a", encoding="utf-8") as f:
-                f.write(json.dumps(error_entry) + "\n")
+            with self._lock:
+                handle = self._get_log_handle()
+                handle.write(line)
+                handle.flush()
         except Exception as e:
             # If we can't write to file, at least print to stderr
             print(f"Failed to write to error log: {e}", file=sys.stderr)
 
+    def _get_log_handle(self) -> TextIO:
+        """Open the log file on first use and reuse the handle afterwards"""
+        if self._log_handle is None:
+            self.log_file.parent.mkdir(parents=True, exist_ok=True)
+            self._log_handle = open(self.log_file, "a", encoding="utf-8")
+        return self._log_handle
+
+    def close(self) -> None:
+        """Close the cached log file handle"""
+        with self._lock:
+            if self._log_handle is not None:
+                self._log_handle.close()
+                self._log_handle = None
+
 
 class DebugLogger:
     """Simple debug logger for development"""
 
     def __init__(self, name: str = "cchh"):
         self.logger = logging.getLogger(name)
-        self.logger.setLevel(logging.DEBUG)
+        self.logger.setLevel(_get_log_level())
 
         # Only add handler if not already added
         if not self.logger.handlers:
@@ -61,39 +104,37 @@ class DebugLogger:
             handler.setFormatter(formatter)
             self.logger.addHandler(handler)
 
-    def debug(self, message: str, **kwargs) -> None:
+    def debug(self, message: str, *args: Any, **kwargs) -> None:
         """Log debug message"""
-        self.logger.debug(message, **kwargs)
+        self.logger.debug(message, *args, **kwargs)
 
-    def info(self, message: str, **kwargs) -> None:
+    def info(self, message: str, *args: Any, **kwargs) -> None:
         """Log info message"""
-        self.logger.info(message, **kwargs)
+        self.logger.info(message, *args, **kwargs)
 
-    def warning(self, message: str, **kwargs) -> None:
+    def warning(self, message: str, *args: Any, **kwargs) -> None:
         """Log warning message"""
-        self.logger.warning(message, **kwargs)
+        self.logger.warning(message, *args, **kwargs)
 
-    def error(self, message: str, exc_info: bool = False, **kwargs) -> None:
+    def error(self, message: str, *args: Any, exc_info: bool = False, **kwargs) -> None:
         """Log error message"""
-        self.logger.error(message, exc_info=exc_info, **kwargs)
+        self.logger.error(message, *args, exc_info=exc_info, **kwargs)
 
 
-# Global instances
-_error_logger = None
-_debug_logger = None
+def _get_log_level() -> int:
+    """Get debug logger level from CCHH_LOG_LEVEL (defaults to DEBUG)"""
+    level_name = os.environ.get("CCHH_LOG_LEVEL", "DEBUG").upper()
+    return logging.getLevelNamesMapping().get(level_name, logging.DEBUG)
 
 
+# Global instances
+@functools.cache
 def get_error_logger() -> ErrorLogger:
     """Get global error logger instance"""
-    global _error_logger
-    if _error_logger is None:
-        _error_logger = ErrorLogger()
-    return _error_logger
+    return ErrorLogger()
 
 
+@functools.cache
 def get_debug_logger() -> DebugLogger:
     """Get global debug logger instance"""
-    global _debug_logger
-    if _debug_logger is None:
-        _debug_logger = DebugLogger()
-    return _debug_logger
+    return DebugLogger()
@@ -1,7 +1,14 @@
 """Text processing utilities"""
 
+import os
 import re
 
+from .config import get_home_dir
+
+# Characters that need escaping in markdown
+_MARKDOWN_SPECIAL_CHARS = r"*_`~[]()#+-!|{}"
+_MARKDOWN_SPECIAL_RE = re.compile(f"([{re.escape(_MARKDOWN_SPECIAL_CHARS)}])")
+
 
 def truncate_text(text: str, max_length: int, suffix: str = "...") -> str:
     """Truncate text to specified length
@@ -57,10 +64,7 @@ def escape_markdown(text: str) -> str:
     Returns:
         Escaped text safe for markdown
     """
-    # Characters that need escaping in markdown
-    special_chars = r"*_`~[]()#+-!|{}"
-    pattern = f"([{re.escape(special_chars)}])"
-    return re.sub(pattern, r"\\\1", text)
+    return _MARKDOWN_SPECIAL_RE.sub(r"\\\1", text)
 
 
 def format_file_size(size_bytes: int) -> str:
@@ -119,14 +123,13 @@ def normalize_path(path: str, home_symbol: bool = True) -> str:
     Returns:
         Normalized path
     """
-    import os
-
     # Expand user and normalize
     normalized = os.path.normpath(os.path.expanduser(path))
 
     if home_symbol:
-        home = os.path.expanduser("~")
-        if normalized.startswith(home):
+        home = str(get_home_dir())
+        # Match whole path components only (/home/user2 is not under /home/user)
+        if normalized == home or normalized.startswith(home + os.sep):
             normalized = "~" + normalized[len(home) :]
 
     return normalized
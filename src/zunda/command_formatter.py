@@ -1,54 +1,93 @@
 """Command formatting for Zunda voice synthesis"""
 
+import functools
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any
+
 from ..utils.command_parser import parse_bash_command
 
+# Rule 1: Word to pronunciation mapping (minimal set)
+WORDS: Mapping[str, str] = MappingProxyType(
+    {
+        "npm": "エヌピーエム",
+        "pnpm": "ピーエヌピーエム",
+        "tsx": "ティーエスエックス",
+    }
+)
+
+# Rule 2: How many parts to read for each command prefix
+PARTS_LIMIT: Mapping[tuple[str, ...], int] = MappingProxyType(
+    {
+        # Git - command + subcommand
+        ("git",): 2,
+        # Package managers
+        ("npm",): 2,
+        ("npm", "run"): 3,  # npm run <script>
+        ("yarn",): 2,
+        ("yarn", "run"): 3,
+        ("pnpm",): 2,
+        ("pnpm", "run"): 3,
+        # UV special cases
+        ("uv",): 2,
+        ("uv", "run"): 3,  # uv run <command>
+        ("uv", "run", "task"): 4,  # uv run task <name>
+        # Docker
+        ("docker",): 2,
+        ("docker", "compose"): 3,
+        # GitHub CLI
+        ("gh",): 2,
+        ("gh", "pr"): 3,
+        ("gh", "issue"): 3,
+        # Other tools
+        ("go",): 2,
+        ("go", "mod"): 3,
+        ("cargo",): 2,
+        ("kubectl",): 2,
+        ("terraform",): 2,
+    }
+)
+
+# Trie key holding the parts limit of the command prefix ending at that node
+_LIMIT = None
+
+
+def _build_prefix_trie(
+    parts_limit: Mapping[tuple[str, ...], int],
+) -> dict[str | None, Any]:
+    """Build a token trie from command prefixes"""
+    trie: dict[str | None, Any] = {}
+    for prefix, limit in parts_limit.items():
+        node = trie
+        for token in prefix:
+            node = node.setdefault(token, {})
+        node[_LIMIT] = limit
+    return trie
+
+
+_PARTS_LIMIT_TRIE = _build_prefix_trie(PARTS_LIMIT)
+_MAX_PREFIX_PARTS = max(map(len, PARTS_LIMIT))
+
 
 class CommandFormatter:
     """Formats commands for voice synthesis (simplified)"""
 
     def __init__(self):
-        # Rule 1: Word to pronunciation mapping (minimal set)
-        self.words: dict[str, str] = {
-            "npm": "エヌピーエム",
-            "pnpm": "ピーエヌピーエム",
-            "tsx": "ティーエスエックス",
-        }
-
-        # Rule 2: How many parts to read for each command pattern
-        self.parts_limit: dict[str, int] = {
-            # Git - command + subcommand
-            "git": 2,
-            # Package managers
-            "npm": 2,
-            "npm run": 3,  # npm run <script>
-            "yarn": 2,
-            "yarn run": 3,
-            "pnpm": 2,
-            "pnpm run": 3,
-            # UV special cases
-            "uv": 2,
-            "uv run": 3,  # uv run <command>
-            "uv run task": 4,  # uv run task <name>
-            # Docker
-            "docker": 2,
-            "docker compose": 3,
-            # GitHub CLI
-            "gh": 2,
-            "gh pr": 3,
-            "gh issue": 3,
-            # Other tools
-            "go": 2,
-            "go mod": 3,
-            "cargo": 2,
-            "kubectl": 2,
-            "terraform": 2,
-        }
+        self.words = WORDS
+        self.parts_limit = PARTS_LIMIT
+
+        # Sessions repeat the same commands, so remember formatted results
+        self._format_cached = functools.lru_cache(maxsize=512)(self._format)
 
     def format(self, command: str) -> str:
         """Format command for voice synthesis
 
         Returns a very simplified, speakable version of the command.
         """
+        return self._format_cached(command)
+
+    def _format(self, command: str) -> str:
+        """Format command without consulting the cache"""
         # Parse command
         parsed = parse_bash_command(command)
         parts = [parsed["command"]] + (
@@ -74,15 +113,13 @@ class CommandFormatter:
 
     def _get_parts_limit(self, parts: list[str]) -> int:
         """Determine how many parts to read"""
-        # Check explicit limits (longest match first)
-        for length in range(min(4, len(parts)), 0, -1):
-            key = " ".join(parts[:length])
-            if key in self.parts_limit:
-                return self.parts_limit[key]
-
-        # Check single command patterns
-        if parts and parts[0] in self.parts_limit:
-            return self.parts_limit[parts[0]]
-
-        # Default: just the command
-        return 1
+        # Walk the trie once; the deepest prefix with a limit wins
+        limit = 1
+        node = _PARTS_LIMIT_TRIE
+        for part in parts[:_MAX_PREFIX_PARTS]:
+            child = node.get(part)
+            if child is None:
+                break
+            node = child
+            limit = node.get(_LIMIT, limit)
+        return limit
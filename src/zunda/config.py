@@ -1,8 +1,10 @@
 """Zundaspeak configuration"""
 
-import os
+import re
 from enum import Enum
 
+from ..utils.config import get_bool_env
+
 
 class ZundaspeakStyle(Enum):
     """Zundaspeakの読み上げスタイル"""
@@ -26,26 +28,27 @@ class ZundaConfig:
         self.default_style = ZundaspeakStyle.NORMAL
 
         # Silent commands (commands that should not be spoken)
-        self.silent_commands = [
+        # A tuple, since the pattern below is compiled from it once
+        self.silent_commands = (
             "git status",
             "git log",
             "git diff",
             "ls",
             "pwd",
             "cat",
-        ]
+        )
+        # All silent prefixes matched in a single pass
+        self._silent_pattern = re.compile(
+            "|".join(re.escape(silent_cmd) for silent_cmd in self.silent_commands)
+        )
 
     def _get_bool_env(self, key: str, default: bool) -> bool:
         """Get boolean value from environment variable"""
-        value = os.environ.get(key, str(default)).lower()
-        return value in ("1", "true", "yes")
+        return get_bool_env(key, default)
 
     def is_silent_command(self, command: str) -> bool:
         """Check if command should be silent"""
-        return any(
-            command.strip().startswith(silent_cmd)
-            for silent_cmd in self.silent_commands
-        )
+        return self._silent_pattern.match(command.strip()) is not None
 
 
 # Global instance
@@ -2,6 +2,41 @@
 
 import re
 
+# 特定のパターンを読みやすく変換
+_REPLACEMENTS = {
+    # プログラミング用語
+    "TODO": "トゥードゥー",
+    "FIXME": "フィックスミー",
+    "TODO:": "トゥードゥー、",
+    "FIXME:": "フィックスミー、",
+    "README": "リードミー",
+    "API": "エーピーアイ",
+    "URL": "ユーアールエル",
+    "JSON": "ジェイソン",
+    "XML": "エックスエムエル",
+    "HTML": "エイチティーエムエル",
+    "CSS": "シーエスエス",
+    "JS": "ジェイエス",
+    "TS": "ティーエス",
+    "HTTP": "エイチティーティーピー",
+    "HTTPS": "エイチティーティーピーエス",
+    # 記号
+    "->": "矢印",
+    "=>": "矢印",
+    "...": "てんてんてん",
+    # その他
+    "@": "アット",
+    "#": "シャープ",
+    "&": "アンド",
+}
+
+# Patterns compiled once at import instead of on every format call
+_WHITESPACE_RE = re.compile(r"\s+")
+_CODE_FENCE_RE = re.compile(r"```[a-z]*")
+_INLINE_CODE_RE = re.compile(r"`([^`]+)`")
+_URL_RE = re.compile(r"https?://[^\s]+")
+_FILE_PATH_RE = re.compile(r"[/\\]([^/\\]+\.[a-z]+)")
+
 
 class PromptFormatter:
     """Formats user prompts for voice synthesis"""
@@ -19,7 +54,7 @@ class PromptFormatter:
         prompt = prompt.replace("\n", " ")
 
         # 複数スペースを単一スペースに
-        prompt = re.sub(r"\s+", " ", prompt).strip()
+        prompt = _WHITESPACE_RE.sub(" ", prompt).strip()
 
         # 長すぎるプロンプトは要約
         if len(prompt) > 100:
@@ -30,50 +65,21 @@ class PromptFormatter:
                 truncated = truncated.rsplit(" ", 1)[0]
             return f"{truncated}、という指示なのだ"
 
-        # 特定のパターンを読みやすく変換
-        replacements = {
-            # プログラミング用語
-            "TODO": "トゥードゥー",
-            "FIXME": "フィックスミー",
-            "TODO:": "トゥードゥー、",
-            "FIXME:": "フィックスミー、",
-            "README": "リードミー",
-            "API": "エーピーアイ",
-            "URL": "ユーアールエル",
-            "JSON": "ジェイソン",
-            "XML": "エックスエムエル",
-            "HTML": "エイチティーエムエル",
-            "CSS": "シーエスエス",
-            "JS": "ジェイエス",
-            "TS": "ティーエス",
-            "HTTP": "エイチティーティーピー",
-            "HTTPS": "エイチティーティーピーエス",
-            # 記号
-            "->": "矢印",
-            "=>": "矢印",
-            "...": "てんてんてん",
-            # その他
-            "@": "アット",
-            "#": "シャープ",
-            "&": "アンド",
-        }
-
         formatted = prompt
-        for old, new in replacements.items():
+        for old, new in _REPLACEMENTS.items():
             formatted = formatted.replace(old, new)
 
         # コードブロックやマークダウンを簡略化
-        formatted = re.sub(r"```[a-z]*", "コードブロック開始", formatted)
+        formatted = _CODE_FENCE_RE.sub("コードブロック開始", formatted)
         formatted = formatted.replace("```", "コードブロック終了")
-        formatted = re.sub(
-            r"`([^`]+)`", r"\1", formatted
-        )  # インラインコードの記号を除去
+        # インラインコードの記号を除去
+        formatted = _INLINE_CODE_RE.sub(r"\1", formatted)
 
         # URLを簡略化
-        formatted = re.sub(r"https?://[^\s]+", "URL", formatted)
+        formatted = _URL_RE.sub("URL", formatted)
 
         # ファイルパスを読みやすく
-        formatted = re.sub(r"[/\\]([^/\\]+\.[a-z]+)", r"、\1ファイル", formatted)
+        formatted = _FILE_PATH_RE.sub(r"、\1ファイル", formatted)
 
         # 最後に「なのだ」を追加（既に付いていない場合）
         if not formatted.endswith("のだ") and not formatted.endswith("なのだ"):
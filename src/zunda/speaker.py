@@ -7,9 +7,10 @@ import urllib.parse
 
 from ..core.base import BaseHandler
 from ..core.types import HookEvent, HookEventName
-from ..utils.logger import get_error_logger
+from ..utils.config import is_test_environment
+from ..utils.logger import get_debug_logger, get_error_logger
 from .command_formatter import CommandFormatter
-from .config import zunda_config
+from .config import ZundaspeakStyle, zunda_config
 
 # Zundamon message templates
 ZUNDAMON_MESSAGES = {
@@ -45,14 +46,61 @@ ZUNDAMON_MESSAGES = {
     "pre_compact": "コンテキストが長くなってきたのだ。そろそろ新しいセッションを始めるのがおすすめなのだ",
 }
 
+# Templated messages, bound once so event handling skips the dict lookups
+_format_task_with_description = ZUNDAMON_MESSAGES["task_with_description"].format
+_format_bash_command = ZUNDAMON_MESSAGES["bash_command"].format
+_format_web_fetch = ZUNDAMON_MESSAGES["web_fetch"].format
+
+# Notification text -> (voice message, style); permission messages use AMAAMA
+_NOTIFICATION_VOICES: dict[str, tuple[str, str | None]] = {
+    text: (
+        message,
+        ZundaspeakStyle.AMAAMA.value if "permission" in text.lower() else None,
+    )
+    for text, message in ZUNDAMON_MESSAGES.items()
+    if message
+}
+
+# ホワイトリスト方式: 安全な文字のみ許可
+# - ひらがな、カタカナ、漢字 (CJK統合漢字)
+# - ASCII英数字
+# - 基本的な句読点・記号
+# - コマンド用文字（パス、オプションなど）
+# - 空白文字
+# Negated so that everything else is removed in a single substitution
+_UNSAFE_CHAR_RE = re.compile(
+    r"[^"
+    r"\u3040-\u309F"
+    r"\u30A0-\u30FF"
+    r"\u4E00-\u9FAF"
+    r"\uFF01-\uFF60"
+    r"a-zA-Z0-9"
+    r"\s.,!?()\[\]{}「」\'"
+    r"・ー〜：；"
+    r"/\-_=@#%&*+<>:"
+    r"]"
+)
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# Handler method per event; StrEnum keys also match the raw name strings
+_EVENT_HANDLERS: dict[str, str] = {
+    HookEventName.PRE_TOOL_USE: "_handle_pre_tool_use",
+    HookEventName.NOTIFICATION: "_handle_notification",
+    HookEventName.STOP: "_handle_stop",
+    HookEventName.PRE_COMPACT: "_handle_pre_compact",
+}
+
 
 class ZundaSpeaker(BaseHandler):
     """Handles Zunda voice notifications"""
 
     def __init__(self):
         self.enabled = zunda_config.enabled
+        self.default_style = zunda_config.default_style.value
         self.command_formatter = CommandFormatter()
         self.error_logger = get_error_logger()
+        self.debug_logger = get_debug_logger()
+        self.debug_enabled = os.getenv("CCHH_ZUNDA_DEBUG", "").lower() == "true"
 
     def handle_event(self, event: HookEvent) -> None:
         """Handle incoming hook event"""
@@ -63,15 +111,9 @@ class ZundaSpeaker(BaseHandler):
         if self._is_test_environment():
             return
 
-        # PreToolUseイベントの処理
-        if event.hook_event_name in (HookEventName.PRE_TOOL_USE, "PreToolUse"):
-            self._handle_pre_tool_use(event)
-        elif event.hook_event_name in (HookEventName.NOTIFICATION, "Notification"):
-            self._handle_notification(event)
-        elif event.hook_event_name in (HookEventName.STOP, "Stop"):
-            self._handle_stop(event)
-        elif event.hook_event_name in (HookEventName.PRE_COMPACT, "PreCompact"):
-            self._handle_pre_compact(event)
+        handler_name = _EVENT_HANDLERS.get(event.hook_event_name)
+        if handler_name:
+            getattr(self, handler_name)(event)
 
     def _handle_pre_tool_use(self, event: HookEvent) -> None:
         """Handle PreToolUse event"""
@@ -83,9 +125,7 @@ class ZundaSpeaker(BaseHandler):
         if event.tool_name == "Task":
             description = event.tool_input.get("description", "")
             if description:
-                voice_message = ZUNDAMON_MESSAGES["task_with_description"].format(
-                    description=description
-                )
+                voice_message = _format_task_with_description(description=description)
             else:
                 voice_message = ZUNDAMON_MESSAGES["task_execute"]
 
@@ -94,21 +134,16 @@ class ZundaSpeaker(BaseHandler):
             if cmd and not zunda_config.is_silent_command(cmd):
                 # コマンドを読みやすい日本語に変換
                 readable_cmd = self.command_formatter.format(cmd)
-                voice_message = ZUNDAMON_MESSAGES["bash_command"].format(
-                    command=readable_cmd
-                )
+                voice_message = _format_bash_command(command=readable_cmd)
 
-                # Debug log for voice synthesis (only in non-test environment)
-                if (
-                    not self._is_test_environment()
-                    and os.getenv("CCHH_ZUNDA_DEBUG", "").lower() == "true"
-                ):
-                    debug_log_path = os.path.join(os.getcwd(), "zunda_debug.log")
-                    with open(debug_log_path, "a", encoding="utf-8") as f:
-                        f.write(f"Original: {repr(cmd)}\n")
-                        f.write(f"Readable: {repr(readable_cmd)}\n")
-                        f.write(f"Voice message: {repr(voice_message)}\n")
-                        f.write("---\n")
+                # Debug log for voice synthesis
+                if self.debug_enabled:
+                    self.debug_logger.debug(
+                        "Zunda voice: original=%r readable=%r message=%r",
+                        cmd,
+                        readable_cmd,
+                        voice_message,
+                    )
 
         elif event.tool_name == "TodoWrite":
             # TodoWriteは読み上げない（通知が多すぎるため）
@@ -120,7 +155,7 @@ class ZundaSpeaker(BaseHandler):
                 # URLを読みやすく短縮
                 parsed_url = urllib.parse.urlparse(url)
                 domain = parsed_url.netloc or url[:50]  # ドメインまたは最初の50文字
-                voice_message = ZUNDAMON_MESSAGES["web_fetch"].format(url=domain)
+                voice_message = _format_web_fetch(url=domain)
 
         if voice_message:
             self._speak(voice_message)
@@ -130,24 +165,14 @@ class ZundaSpeaker(BaseHandler):
         if not event.notification:
             return
 
-        text = event.notification
-
         # メッセージ変換マップで処理
-        voice_message = ZUNDAMON_MESSAGES.get(text)
-
-        if voice_message:
-            # Permission messages use AMAAMA style
-            if "permission" in text.lower():
-                from .config import ZundaspeakStyle
-
-                self._speak(voice_message, style=ZundaspeakStyle.AMAAMA.value)
-            else:
-                self._speak(voice_message)
+        voice = _NOTIFICATION_VOICES.get(event.notification)
+        if voice:
+            voice_message, style = voice
+            self._speak(voice_message, style=style)
 
     def _handle_stop(self, event: HookEvent) -> None:
         """Handle Stop event"""
-        from .config import ZundaspeakStyle
-
         self._speak(ZUNDAMON_MESSAGES["session_end"], style=ZundaspeakStyle.SEXY.value)
 
     def _handle_pre_compact(self, event: HookEvent) -> None:
@@ -164,30 +189,19 @@ class ZundaSpeaker(BaseHandler):
         if not sanitized_message:
             return
 
-        style = style or zunda_config.default_style.value
+        style = style or self.default_style
 
         try:
-            # zundaspeak コマンドを実行
-            result = subprocess.run(
+            # zundaspeak コマンドを実行（終了は待たない）
+            # Output is discarded, so no pipes are created or drained; a new
+            # session keeps playback going after the hook process exits
+            subprocess.Popen(
                 ["zundaspeak", "-s", style, sanitized_message],
-                capture_output=True,
-                check=False,  # エラーでも例外を発生させない
-                text=True,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                start_new_session=True,
             )
-            # コマンド実行エラーをログに記録
-            if result.returncode != 0:
-                self.error_logger.log_error(
-                    error_type="zundaspeak_command_failed",
-                    error_message=f"zundaspeak exited with code {result.returncode}",
-                    context={
-                        "original_message": message,
-                        "sanitized_message": sanitized_message,
-                        "style": style,
-                        "stderr": result.stderr,
-                        "stdout": result.stdout,
-                        "return_code": result.returncode,
-                    },
-                )
         except FileNotFoundError:
             # zundaspeak がインストールされていない場合
             if not hasattr(self, "_zundaspeak_warning_shown"):
@@ -219,38 +233,11 @@ class ZundaSpeaker(BaseHandler):
         if len(message) > MAX_MESSAGE_LENGTH:
             message = message[:MAX_MESSAGE_LENGTH]
 
-        # ホワイトリスト方式: 安全な文字のみ許可
-        # - ひらがな、カタカナ、漢字 (CJK統合漢字)
-        # - ASCII英数字
-        # - 基本的な句読点・記号
-        # - コマンド用文字（パス、オプションなど）
-        # - 空白文字
-        safe_pattern = (
-            r"["
-            r"\u3040-\u309F"
-            r"]|["
-            r"\u30A0-\u30FF"
-            r"]|["
-            r"\u4E00-\u9FAF"
-            r"]|["
-            r"\uFF01-\uFF60"
-            r"]|["
-            r"a-zA-Z0-9"
-            r"]|["
-            r"\s.,!?()[\]{}「」\'"
-            r"]|["
-            r"・ー〜：；"
-            r"]|["
-            r"/\-_=@#%&*+<>:"
-            r"]"
-        )
-
-        # 安全な文字のみを抽出
-        safe_chars = re.findall(safe_pattern, message)
-        sanitized = "".join(safe_chars)
+        # 安全な文字のみを残す
+        sanitized = _UNSAFE_CHAR_RE.sub("", message)
 
         # 連続する空白を単一の空白に正規化
-        sanitized = re.sub(r"\s+", " ", sanitized)
+        sanitized = _WHITESPACE_RE.sub(" ", sanitized)
 
         # 前後の空白を削除
         sanitized = sanitized.strip()
@@ -259,8 +246,4 @@ class ZundaSpeaker(BaseHandler):
 
     def _is_test_environment(self) -> bool:
         """Check if running in test environment"""
-        return os.environ.get("CCHH_TEST_ENVIRONMENT", "").lower() in (
-            "1",
-            "true",
-            "yes",
-        )
+        return is_test_environment()
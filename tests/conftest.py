@@ -10,17 +10,21 @@ import pytest
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
+from src.utils.config import is_test_environment  # noqa: E402
+
 
 @pytest.fixture(autouse=True)
 def test_environment():
     """Automatically set TEST_ENVIRONMENT for all tests"""
     original = os.environ.get("CCHH_TEST_ENVIRONMENT")
     os.environ["CCHH_TEST_ENVIRONMENT"] = "true"
+    is_test_environment.cache_clear()
     yield
     if original is None:
         os.environ.pop("CCHH_TEST_ENVIRONMENT", None)
     else:
         os.environ["CCHH_TEST_ENVIRONMENT"] = original
+    is_test_environment.cache_clear()
 
 
 @pytest.fixture
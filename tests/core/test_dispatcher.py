@@ -5,7 +5,8 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
-from src.core.dispatcher import EventDispatcher
+from src.core import dispatcher as dispatcher_module
+from src.core.dispatcher import EventDispatcher, get_dispatcher
 from src.core.types import HookEvent
 
 
@@ -115,3 +116,19 @@ class TestEventDispatcher:
 
         captured = capsys.readouterr()
         assert "Warning: Logger module not found" in captured.out
+
+
+class TestGetDispatcher:
+    """Test cases for get_dispatcher"""
+
+    def test_returns_cached_instance(self):
+        """Test that handlers are built once and reused"""
+        get_dispatcher.cache_clear()
+
+        with patch.object(dispatcher_module, "EventDispatcher") as mock_class:
+            first = get_dispatcher()
+            second = get_dispatcher()
+        get_dispatcher.cache_clear()
+
+        assert first is second
+        mock_class.assert_called_once_with()
@@ -0,0 +1,81 @@
+"""Test cases for core hook types"""
+
+import pytest
+
+from src.core.types import HookEvent, HookEventName
+
+
+class TestHookEventFromDict:
+    """Test cases for HookEvent.from_dict"""
+
+    @pytest.mark.parametrize("member", list(HookEventName))
+    def test_known_event_name_becomes_enum(self, member):
+        """Test that known event names are converted to the enum member"""
+        event = HookEvent.from_dict({"hook_event_name": member.value})
+        assert event.hook_event_name is member
+
+    def test_unknown_event_name_kept_as_string(self):
+        """Test that unknown event names are kept unchanged"""
+        event = HookEvent.from_dict({"hook_event_name": "SubagentStop"})
+        assert event.hook_event_name == "SubagentStop"
+
+    def test_missing_event_name_defaults_to_unknown(self):
+        """Test that a missing event name defaults to Unknown"""
+        event = HookEvent.from_dict({"session_id": "abc"})
+        assert event.hook_event_name == "Unknown"
+        assert event.session_id == "abc"
+
+
+class TestHookEventToDict:
+    """Test cases for HookEvent.to_dict"""
+
+    def test_includes_only_set_optional_fields(self):
+        """Test that empty optional fields are left out of the output"""
+        event = HookEvent(
+            hook_event_name=HookEventName.PRE_TOOL_USE,
+            session_id="abc",
+            cwd="/tmp",
+            tool_name="Bash",
+            tool_input={"command": "ls"},
+            output="",
+        )
+
+        assert event.to_dict() == {
+            "hook_event_name": "PreToolUse",
+            "session_id": "abc",
+            "cwd": "/tmp",
+            "tool_name": "Bash",
+            "tool_input": {"command": "ls"},
+        }
+
+    def test_preserves_non_standard_raw_fields(self):
+        """Test that unknown fields from raw_data are passed through"""
+        data = {
+            "hook_event_name": "Stop",
+            "session_id": "abc",
+            "cwd": "/tmp",
+            "transcript_path": "/tmp/t.jsonl",
+            "prompt": "hello",
+        }
+
+        result = HookEvent.from_dict(data).to_dict()
+
+        assert result["transcript_path"] == "/tmp/t.jsonl"
+        assert "prompt" not in result
+
+    def test_uses_slots(self):
+        """Test that instances do not carry a per-instance __dict__"""
+        event = HookEvent(hook_event_name="Stop", session_id="", cwd="")
+        assert not hasattr(event, "__dict__")
+
+
+class TestHookEventName:
+    """Test cases for HookEventName"""
+
+    def test_members_equal_raw_names(self):
+        """Test that members compare and hash equal to their string value"""
+        assert HookEventName.STOP == "Stop"
+        assert {HookEventName.STOP: 1}["Stop"] == 1
+
+        result = HookEvent.from_dict({"hook_event_name": "Stop"}).to_dict()
+        assert result["hook_event_name"] == "Stop"
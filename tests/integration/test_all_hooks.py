@@ -165,6 +165,21 @@ class TestAllHooksIntegration:
         # Should handle the error gracefully
         assert result.returncode != 0 or "error" in result.stderr.lower()
 
+    def test_invalid_event_is_echoed_unchanged(self):
+        """Test that a payload rejected after parsing is still passed through"""
+        payload = '{"session_id": "test-session", "cwd": "/test"}'
+
+        result = subprocess.run(
+            [sys.executable, "all_hooks.py"],
+            input=payload,
+            capture_output=True,
+            text=True,
+            cwd=Path(__file__).parent.parent.parent,
+        )
+
+        assert result.returncode == 1
+        assert result.stdout == payload
+
     def test_multiple_events_sequence(self, sample_events):
         """Test processing multiple events in sequence"""
         events = [
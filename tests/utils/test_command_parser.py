@@ -0,0 +1,121 @@
+"""Tests for command parsing utilities"""
+
+from unittest.mock import patch
+
+import pytest
+
+from src.utils.command_parser import (
+    extract_command_name,
+    get_command_category,
+    is_pipeline_command,
+    parse_bash_command,
+)
+
+
+class TestParseBashCommand:
+    """Test cases for parse_bash_command function"""
+
+    @pytest.mark.parametrize(
+        ("command", "expected_command", "expected_args"),
+        [
+            ("git status", "git", ["status"]),
+            ("npm run build --production", "npm", ["run", "build"]),
+            ("  ls\t-la   /tmp  ", "ls", []),
+            ("echo a|b > out.txt", "echo", ["a|b", ">", "out.txt"]),
+        ],
+    )
+    def test_simple_commands_skip_shlex(self, command, expected_command, expected_args):
+        """Test that unquoted commands are tokenized without shlex"""
+        with patch("src.utils.command_parser.shlex.split") as mock_split:
+            result = parse_bash_command(command)
+            mock_split.assert_not_called()
+
+        assert result["command"] == expected_command
+        assert result["args"] == expected_args
+
+    def test_quoted_command_uses_shlex(self):
+        """Test that quoted arguments are still parsed by shlex"""
+        result = parse_bash_command("git commit -m 'fix: update config'")
+
+        assert result["command"] == "git"
+        assert result["args"] == ["commit"]
+        assert result["options"] == {"-m": "fix: update config"}
+
+    def test_unbalanced_quotes_fall_back_to_split(self):
+        """Test that shlex errors fall back to whitespace splitting"""
+        result = parse_bash_command("echo 'unterminated")
+
+        assert result["command"] == "echo"
+        assert result["args"] == ["'unterminated"]
+
+    def test_empty_command(self):
+        """Test that empty commands produce an empty result"""
+        result = parse_bash_command("   ")
+
+        assert result["command"] == ""
+        assert result["args"] == []
+
+
+class TestGetCommandCategory:
+    """Test cases for get_command_category function"""
+
+    @pytest.mark.parametrize(
+        ("command", "expected"),
+        [
+            ("git status", "git"),
+            ("gh pr list", "git"),
+            ("uv run pytest", "npm"),
+            ("docker compose up", "docker"),
+            ("rm -rf build", "file"),
+            ("sudo systemctl restart nginx", "system"),
+            ("echo hello", "other"),
+            ("", "other"),
+        ],
+    )
+    def test_categories(self, command, expected):
+        """Test categorization by the first token of the command"""
+        assert get_command_category(command) == expected
+
+
+class TestIsPipelineCommand:
+    """Test cases for is_pipeline_command function"""
+
+    @pytest.mark.parametrize(
+        ("command", "expected"),
+        [
+            ("ls | grep foo", True),
+            ("echo hi > out.txt", True),
+            ("echo hi >> out.txt", True),
+            ("wc -l < in.txt", True),
+            ("cat << EOF", True),
+            ("git status", False),
+            ("", False),
+        ],
+    )
+    def test_detects_pipes_and_redirections(self, command, expected):
+        """Test detection of pipe and redirection operators"""
+        assert is_pipeline_command(command) is expected
+
+
+class TestExtractCommandName:
+    """Test cases for extract_command_name function"""
+
+    @pytest.mark.parametrize(
+        "command",
+        [
+            "ls",
+            "  git commit -m fix  ",
+            "npm\trun test",
+            "'my tool' --flag",
+            'echo "hello world"',
+            "cat path\\ with\\ spaces",
+            "echo 'unterminated",
+            "",
+            "   ",
+            "\u3000",
+            "\x0b",
+        ],
+    )
+    def test_matches_full_parse(self, command):
+        """Test that the fast path agrees with parse_bash_command"""
+        assert extract_command_name(command) == parse_bash_command(command)["command"]
@@ -0,0 +1,46 @@
+"""Test cases for global configuration utilities"""
+
+import pytest
+
+from src.utils.config import get_bool_env, is_test_environment
+
+
+class TestGetBoolEnv:
+    """Test cases for get_bool_env function"""
+
+    @pytest.mark.parametrize(
+        "value,expected",
+        [
+            ("1", True),
+            ("true", True),
+            ("TRUE", True),
+            ("yes", True),
+            ("false", False),
+            ("0", False),
+            ("", False),
+        ],
+    )
+    def test_parses_value(self, monkeypatch, value, expected):
+        """Test that truthy spellings are accepted case-insensitively"""
+        monkeypatch.setenv("CCHH_TEST_FLAG", value)
+        assert get_bool_env("CCHH_TEST_FLAG", not expected) is expected
+
+    @pytest.mark.parametrize("default", [True, False])
+    def test_unset_returns_default(self, monkeypatch, default):
+        """Test that the default is returned when the variable is unset"""
+        monkeypatch.delenv("CCHH_TEST_FLAG", raising=False)
+        assert get_bool_env("CCHH_TEST_FLAG", default) is default
+
+
+class TestIsTestEnvironment:
+    """Test cases for is_test_environment function"""
+
+    def test_value_cached_until_cleared(self, monkeypatch):
+        """Test that the environment is read once until the cache is cleared"""
+        assert is_test_environment() is True
+
+        monkeypatch.setenv("CCHH_TEST_ENVIRONMENT", "false")
+        assert is_test_environment() is True
+
+        is_test_environment.cache_clear()
+        assert is_test_environment() is False
@@ -2,11 +2,19 @@
 
 import io
 import json
+import os
+import stat
 
 import pytest
 
-from src.core.types import HookEventName
-from src.utils.io_helpers import _normalize_hook_event_data, load_hook_event
+from src.core.types import HookEvent, HookEventName
+from src.utils.io_helpers import (
+    _normalize_hook_event_data,
+    load_hook_event,
+    load_json_file,
+    save_json_file,
+    write_hook_event,
+)
 
 
 class TestLoadHookEvent:
@@ -52,6 +60,24 @@ class TestLoadHookEvent:
         assert event.tool_input == {"command": "echo test"}
         assert event.notification is None  # Should not have notification
 
+    def test_load_from_binary_buffer(self):
+        """Test loading from a text stream backed by a binary buffer (like stdin)"""
+        event_data = {
+            "session_id": "test-session",
+            "cwd": "/test",
+            "hook_event_name": "UserPromptSubmit",
+            "prompt": "日本語のプロンプト",
+        }
+
+        stream = io.TextIOWrapper(
+            io.BytesIO(json.dumps(event_data, ensure_ascii=False).encode("utf-8")),
+            encoding="utf-8",
+        )
+        event = load_hook_event(stream)
+
+        assert event.hook_event_name == HookEventName.USER_PROMPT_SUBMIT
+        assert event.prompt == "日本語のプロンプト"
+
     def test_missing_hook_event_name(self):
         """Test error handling for missing hook_event_name"""
         event_data = {
@@ -84,6 +110,8 @@ class TestLoadHookEvent:
         assert event.hook_event_name == HookEventName.NOTIFICATION
         assert event.session_id == "unknown"
         assert event.cwd is not None  # Should be set to current directory
+        # Defaults are not written back into the original payload
+        assert event.raw_data == event_data
 
 
 class TestNormalizeHookEventData:
@@ -155,6 +183,30 @@ class TestNormalizeHookEventData:
         # Should not override existing notification (defensive programming)
         assert result["notification"] == "Existing notification field"
 
+    def test_unchanged_data_not_copied(self):
+        """Test that data needing no mapping is returned without copying"""
+        data = {
+            "hook_event_name": "PreToolUse",
+            "session_id": "test-session",
+            "cwd": "/test",
+        }
+
+        assert _normalize_hook_event_data(data) is data
+
+    def test_mapping_does_not_mutate_input(self):
+        """Test that mapping message to notification leaves the input intact"""
+        data = {
+            "hook_event_name": "Notification",
+            "session_id": "test-session",
+            "cwd": "/test",
+            "message": "Permission required",
+        }
+
+        result = _normalize_hook_event_data(data)
+
+        assert result["notification"] == "Permission required"
+        assert "notification" not in data
+
     def test_notification_field_from_message(self):
         """Test that message field is converted to notification field"""
         event_data = {
@@ -171,3 +223,88 @@ class TestNormalizeHookEventData:
         # Verify message was converted to notification field
         assert event.notification == "Claude needs your permission to use Bash"
         assert isinstance(event.notification, str)
+
+
+class TestWriteHookEvent:
+    """Test cases for write_hook_event function"""
+
+    def test_passthrough_echoes_original_input(self):
+        """Test that a loaded event is written back byte-for-byte"""
+        raw = '{"hook_event_name": "Notification", "cwd": "/test",  "message": "hi"}'
+
+        event = load_hook_event(io.StringIO(raw))
+        output = io.StringIO()
+        write_hook_event(event, output)
+
+        assert output.getvalue() == raw
+
+    def test_passthrough_echoes_original_bytes(self):
+        """Test that bytes read from a binary buffer are echoed unchanged"""
+        raw = b'{"hook_event_name":"Stop","session_id":"s","cwd":"/t"}'
+
+        event = load_hook_event(io.TextIOWrapper(io.BytesIO(raw), encoding="utf-8"))
+        out_buffer = io.BytesIO()
+        output = io.TextIOWrapper(out_buffer, encoding="utf-8")
+        write_hook_event(event, output)
+
+        assert out_buffer.getvalue() == raw
+
+    def test_constructed_event_is_serialized(self):
+        """Test that events without raw input are serialized from fields"""
+        event = HookEvent(
+            hook_event_name=HookEventName.STOP,
+            session_id="test-session",
+            cwd="/test",
+        )
+        output = io.StringIO()
+        write_hook_event(event, output)
+
+        assert json.loads(output.getvalue()) == {
+            "hook_event_name": "Stop",
+            "session_id": "test-session",
+            "cwd": "/test",
+        }
+
+
+class TestSaveJsonFile:
+    """Test cases for save_json_file function"""
+
+    def test_round_trip(self, tmp_path):
+        """Test that saved data loads back unchanged"""
+        path = tmp_path / "state.json"
+        save_json_file({"thread": "ずんだ", "count": 1}, str(path))
+
+        assert load_json_file(str(path)) == {"thread": "ずんだ", "count": 1}
+        assert list(tmp_path.iterdir()) == [path]
+
+    def test_failed_write_keeps_previous_file(self, tmp_path):
+        """Test that a serialization error leaves the old file and no temp file"""
+        path = tmp_path / "state.json"
+        save_json_file({"version": 1}, str(path))
+
+        with pytest.raises(TypeError):
+            save_json_file({"version": object()}, str(path))
+
+        assert load_json_file(str(path)) == {"version": 1}
+        assert list(tmp_path.iterdir()) == [path]
+
+    def test_existing_file_mode_preserved(self, tmp_path):
+        """Test that overwriting keeps the existing file's permissions"""
+        path = tmp_path / "state.json"
+        path.write_text("{}")
+        path.chmod(0o644)
+
+        save_json_file({"version": 2}, str(path))
+
+        assert stat.S_IMODE(path.stat().st_mode) == 0o644
+
+    def test_new_file_mode_follows_umask(self, tmp_path):
+        """Test that a new file gets the mode open() would give it"""
+        path = tmp_path / "state.json"
+        umask = os.umask(0o022)
+        try:
+            save_json_file({"version": 1}, str(path))
+        finally:
+            os.umask(umask)
+
+        assert stat.S_IMODE(path.stat().st_mode) == 0o644
@@ -0,0 +1,103 @@
+"""Test cases for logging utilities"""
+
+import json
+import logging
+from datetime import UTC, datetime, timedelta
+from unittest.mock import MagicMock, patch
+
+from src.utils.logger import DebugLogger, ErrorLogger, utc_timestamp
+
+
+class TestUtcTimestamp:
+    """Test cases for utc_timestamp function"""
+
+    def test_matches_current_utc_time(self):
+        """Test that the timestamp is ISO 8601 UTC with a Z suffix"""
+        timestamp = utc_timestamp()
+
+        assert timestamp.endswith("Z")
+        parsed = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+        assert abs(datetime.now(UTC) - parsed) < timedelta(seconds=5)
+
+    def test_microseconds_within_same_second(self):
+        """Test that calls within one second share the prefix but not the fraction"""
+        with patch("src.utils.logger.time.time", side_effect=[100.25, 100.5, 101.0]):
+            first = utc_timestamp()
+            second = utc_timestamp()
+            third = utc_timestamp()
+
+        assert first == "1970-01-01T00:01:40.250000Z"
+        assert second == "1970-01-01T00:01:40.500000Z"
+        assert third == "1970-01-01T00:01:41.000000Z"
+
+
+class TestErrorLogger:
+    """Test cases for ErrorLogger"""
+
+    def test_non_ascii_written_verbatim(self, tmp_path):
+        """Test that Japanese context is written as UTF-8, not escaped"""
+        log_file = tmp_path / "errors.log"
+        error_logger = ErrorLogger(log_file=log_file)
+        error_logger.log_error(
+            error_type="zundaspeak_error",
+            error_message="failed",
+            context={"original_message": "終わったのだ"},
+        )
+        error_logger.close()
+
+        content = log_file.read_text(encoding="utf-8")
+        assert "終わったのだ" in content
+        entry = json.loads(content)
+        assert entry["context"]["original_message"] == "終わったのだ"
+
+    def test_log_file_opened_once(self, tmp_path):
+        """Test that the log file handle is reused across errors"""
+        log_file = tmp_path / "nested" / "errors.log"
+        error_logger = ErrorLogger(log_file=log_file)
+        with patch("builtins.open", wraps=open) as mock_open:
+            for i in range(3):
+                error_logger.log_error(error_type="test", error_message=f"e{i}")
+        error_logger.close()
+
+        assert mock_open.call_count == 1
+        assert len(log_file.read_text(encoding="utf-8").splitlines()) == 3
+
+    def test_write_failure_reported_to_stderr(self, tmp_path, capsys):
+        """Test that an unwritable log file does not raise"""
+        blocker = tmp_path / "blocker"
+        blocker.write_text("")
+        error_logger = ErrorLogger(log_file=blocker / "errors.log")
+
+        error_logger.log_error(error_type="test", error_message="boom")
+
+        assert "Failed to write to error log" in capsys.readouterr().err
+
+
+class TestDebugLogger:
+    """Test cases for DebugLogger"""
+
+    def test_level_from_environment(self, monkeypatch):
+        """Test that CCHH_LOG_LEVEL sets the logger level"""
+        monkeypatch.setenv("CCHH_LOG_LEVEL", "info")
+        debug_logger = DebugLogger("cchh.test.level")
+
+        assert debug_logger.logger.isEnabledFor(logging.INFO)
+        assert not debug_logger.logger.isEnabledFor(logging.DEBUG)
+
+    def test_unknown_level_defaults_to_debug(self, monkeypatch):
+        """Test that an unrecognized level falls back to DEBUG"""
+        monkeypatch.setenv("CCHH_LOG_LEVEL", "verbose")
+        debug_logger = DebugLogger("cchh.test.unknown")
+
+        assert debug_logger.logger.isEnabledFor(logging.DEBUG)
+
+    def test_disabled_messages_not_formatted(self, monkeypatch):
+        """Test that arguments are not formatted below the configured level"""
+        monkeypatch.setenv("CCHH_LOG_LEVEL", "WARNING")
+        debug_logger = DebugLogger("cchh.test.lazy")
+        arg = MagicMock()
+
+        debug_logger.debug("value: %s", arg)
+        debug_logger.info("value: %s", arg)
+
+        arg.__str__.assert_not_called()
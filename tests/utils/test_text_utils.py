@@ -0,0 +1,40 @@
+"""Tests for text processing utilities"""
+
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from src.utils.text_utils import normalize_path
+
+
+class TestNormalizePath:
+    """Test cases for normalize_path function"""
+
+    @pytest.fixture(autouse=True)
+    def home_dir(self):
+        """Pin the home directory used for ~ substitution"""
+        with patch(
+            "src.utils.text_utils.get_home_dir", return_value=Path("/home/user")
+        ):
+            yield
+
+    @pytest.mark.parametrize(
+        ("path", "expected"),
+        [
+            ("/home/user", "~"),
+            ("/home/user/src/project", "~/src/project"),
+            ("/home/user/src/../docs", "~/docs"),
+            ("/home/user2/project", "/home/user2/project"),
+            ("/var/log", "/var/log"),
+        ],
+    )
+    def test_home_replaced_with_symbol(self, path, expected):
+        """Test that only paths inside the home directory are abbreviated"""
+        assert normalize_path(path) == expected
+
+    def test_home_symbol_disabled(self):
+        """Test that home_symbol=False keeps the absolute path"""
+        assert normalize_path("/home/user/project", home_symbol=False) == (
+            "/home/user/project"
+        )
@@ -1,7 +1,10 @@
 """Test cases for CommandFormatter"""
 
+from unittest.mock import patch
+
 import pytest
 
+from src.utils.command_parser import parse_bash_command
 from src.zunda.command_formatter import CommandFormatter
 
 
@@ -123,6 +126,18 @@ class TestCommandFormatter:
                 f"Parts {parts} should have limit {expected_limit}, but got {result}"
             )
 
+    def test_repeated_commands_are_cached(self, formatter):
+        """Test that formatting the same command twice parses it only once"""
+        with patch(
+            "src.zunda.command_formatter.parse_bash_command",
+            wraps=parse_bash_command,
+        ) as mock_parse:
+            first = formatter.format("npm run test")
+            second = formatter.format("npm run test")
+
+        assert first == second == "エヌピーエム run test"
+        mock_parse.assert_called_once_with("npm run test")
+
     def test_word_dictionary_lookup(self, formatter):
         """Test word dictionary lookups"""
         # Test only the translations we have
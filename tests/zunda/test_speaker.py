@@ -1,11 +1,12 @@
 """Test cases for Zunda speaker"""
 
 import os
+import subprocess
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from src.core.types import HookEvent
+from src.core.types import HookEvent, HookEventName
 from src.zunda.config import ZundaspeakStyle
 from src.zunda.speaker import ZundaSpeaker
 
@@ -22,6 +23,14 @@ def zunda_speaker():
         return speaker
 
 
+@pytest.fixture
+def mock_popen(monkeypatch):
+    """Replace subprocess.Popen so no zundaspeak process is started"""
+    popen = MagicMock()
+    monkeypatch.setattr(subprocess, "Popen", popen)
+    return popen
+
+
 @pytest.fixture
 def mock_event():
     """Create a mock HookEvent"""
@@ -37,14 +46,13 @@ def mock_event():
 class TestZundaSpeaker:
     """Test cases for ZundaSpeaker"""
 
-    def test_disabled_speaker(self, zunda_speaker, mock_event):
+    def test_disabled_speaker(self, mock_popen, zunda_speaker, mock_event):
         """Test that disabled speaker doesn't speak"""
         zunda_speaker.enabled = False
-        with patch("subprocess.run") as mock_run:
-            zunda_speaker.handle_event(mock_event)
-            mock_run.assert_not_called()
+        zunda_speaker.handle_event(mock_event)
+        mock_popen.assert_not_called()
 
-    def test_handle_pre_tool_use_bash(self, zunda_speaker):
+    def test_handle_pre_tool_use_bash(self, mock_popen, zunda_speaker):
         """Test handling of Bash command"""
         event = HookEvent(
             hook_event_name="PreToolUse",
@@ -54,15 +62,14 @@ class TestZundaSpeaker:
             tool_input={"command": "npm run test"},
         )
 
-        with patch("subprocess.run") as mock_run:
-            zunda_speaker.handle_event(event)
+        zunda_speaker.handle_event(event)
 
-            mock_run.assert_called_once()
-            args = mock_run.call_args[0][0]
-            assert "エヌピーエム" in args[3]
-            assert "run" in args[3]
+        mock_popen.assert_called_once()
+        args = mock_popen.call_args[0][0]
+        assert "エヌピーエム" in args[3]
+        assert "run" in args[3]
 
-    def test_handle_pre_tool_use_task(self, zunda_speaker):
+    def test_handle_pre_tool_use_task(self, mock_popen, zunda_speaker):
         """Test handling of Task tool"""
         event = HookEvent(
             hook_event_name="PreToolUse",
@@ -72,16 +79,15 @@ class TestZundaSpeaker:
             tool_input={"description": "Fix authentication"},
         )
 
-        with patch("subprocess.run") as mock_run:
-            zunda_speaker.handle_event(event)
+        zunda_speaker.handle_event(event)
 
-            mock_run.assert_called_once()
-            args = mock_run.call_args[0][0]
-            assert "タスク" in args[3]
-            assert "Fix authentication" in args[3]
-            assert "実行" in args[3]
+        mock_popen.assert_called_once()
+        args = mock_popen.call_args[0][0]
+        assert "タスク" in args[3]
+        assert "Fix authentication" in args[3]
+        assert "実行" in args[3]
 
-    def test_skip_todo_write(self, zunda_speaker):
+    def test_skip_todo_write(self, mock_popen, zunda_speaker):
         """Test that TodoWrite is skipped"""
         event = HookEvent(
             hook_event_name="PreToolUse",
@@ -91,11 +97,10 @@ class TestZundaSpeaker:
             tool_input={"todos": []},
         )
 
-        with patch("subprocess.run") as mock_run:
-            zunda_speaker.handle_event(event)
-            mock_run.assert_not_called()
+        zunda_speaker.handle_event(event)
+        mock_popen.assert_not_called()
 
-    def test_skip_silent_commands(self, zunda_speaker):
+    def test_skip_silent_commands(self, mock_popen, zunda_speaker):
         """Test that silent commands like git diff are skipped in Zunda"""
         silent_commands = ["git status", "git log", "git diff", "ls", "pwd", "cat"]
 
@@ -108,11 +113,10 @@ class TestZundaSpeaker:
                 tool_input={"command": cmd},
             )
 
-            with patch("subprocess.run") as mock_run:
-                zunda_speaker.handle_event(event)
-                mock_run.assert_not_called()  # Silent command should not trigger speech
+            zunda_speaker.handle_event(event)
+            mock_popen.assert_not_called()  # Silent command should not trigger speech
 
-    def test_non_silent_commands_are_spoken(self, zunda_speaker):
+    def test_non_silent_commands_are_spoken(self, mock_popen, zunda_speaker):
         """Test that non-silent commands are still spoken"""
         event = HookEvent(
             hook_event_name="PreToolUse",
@@ -122,13 +126,33 @@ class TestZundaSpeaker:
             tool_input={"command": "git commit -m 'test'"},
         )
 
-        with patch("subprocess.run") as mock_run:
-            zunda_speaker.handle_event(event)
-            mock_run.assert_called_once()
-            args = mock_run.call_args[0][0]
-            assert "git commit" in args[3]
+        zunda_speaker.handle_event(event)
+        mock_popen.assert_called_once()
+        args = mock_popen.call_args[0][0]
+        assert "git commit" in args[3]
+
+    def test_debug_log_does_not_write_to_cwd(
+        self, mock_popen, zunda_speaker, tmp_path, monkeypatch
+    ):
+        """Test that voice debug output goes to the debug logger, not a cwd file"""
+        zunda_speaker.debug_enabled = True
+        zunda_speaker.debug_logger = MagicMock()
+        event = HookEvent(
+            hook_event_name="PreToolUse",
+            session_id="test-session",
+            cwd=str(tmp_path),
+            tool_name="Bash",
+            tool_input={"command": "npm test"},
+        )
+
+        monkeypatch.chdir(tmp_path)
+        zunda_speaker.handle_event(event)
 
-    def test_handle_web_fetch(self, zunda_speaker):
+        zunda_speaker.debug_logger.debug.assert_called_once()
+        assert "npm test" in zunda_speaker.debug_logger.debug.call_args[0][1:]
+        assert list(tmp_path.iterdir()) == []
+
+    def test_handle_web_fetch(self, mock_popen, zunda_speaker):
         """Test handling of WebFetch operations"""
         event = HookEvent(
             hook_event_name="PreToolUse",
@@ -138,13 +162,12 @@ class TestZundaSpeaker:
             tool_input={"url": "https://example.com/article", "prompt": "Test prompt"},
         )
 
-        with patch("subprocess.run") as mock_run:
-            zunda_speaker.handle_event(event)
-            mock_run.assert_called_once()
-            args = mock_run.call_args[0][0]
-            assert "ウェブサイトexample.comをチェックするのだ" == args[3]
+        zunda_speaker.handle_event(event)
+        mock_popen.assert_called_once()
+        args = mock_popen.call_args[0][0]
+        assert "ウェブサイトexample.comをチェックするのだ" == args[3]
 
-    def test_handle_notification_permission(self, zunda_speaker):
+    def test_handle_notification_permission(self, mock_popen, zunda_speaker):
         """Test handling of permission notifications"""
         event = HookEvent(
             hook_event_name="Notification",
@@ -153,17 +176,14 @@ class TestZundaSpeaker:
             notification="Claude needs your permission to use Bash",
         )
 
-        with patch("subprocess.run") as mock_run:
-            zunda_speaker.handle_event(event)
+        zunda_speaker.handle_event(event)
 
-            mock_run.assert_called_once()
-            args = mock_run.call_args[0][0]
-            assert args[2] == str(
-                ZundaspeakStyle.AMAAMA.value
-            )  # Should use AMAAMA style
-            assert "許可" in args[3]
+        mock_popen.assert_called_once()
+        args = mock_popen.call_args[0][0]
+        assert args[2] == str(ZundaspeakStyle.AMAAMA.value)  # Should use AMAAMA style
+        assert "許可" in args[3]
 
-    def test_handle_notification_fetch_permission(self, zunda_speaker):
+    def test_handle_notification_fetch_permission(self, mock_popen, zunda_speaker):
         """Test handling of Fetch permission notifications"""
         event = HookEvent(
             hook_event_name="Notification",
@@ -172,14 +192,13 @@ class TestZundaSpeaker:
             notification="Claude needs your permission to use Fetch",
         )
 
-        with patch("subprocess.run") as mock_run:
-            zunda_speaker.handle_event(event)
-            mock_run.assert_called_once()
-            args = mock_run.call_args[0][0]
-            assert args[2] == str(ZundaspeakStyle.AMAAMA.value)
-            assert "Webアクセスの許可が欲しいのだ" == args[3]
+        zunda_speaker.handle_event(event)
+        mock_popen.assert_called_once()
+        args = mock_popen.call_args[0][0]
+        assert args[2] == str(ZundaspeakStyle.AMAAMA.value)
+        assert "Webアクセスの許可が欲しいのだ" == args[3]
 
-    def test_handle_stop_event(self, zunda_speaker):
+    def test_handle_stop_event(self, mock_popen, zunda_speaker):
         """Test handling of stop event"""
         event = HookEvent(
             hook_event_name="Stop",
@@ -187,23 +206,47 @@ class TestZundaSpeaker:
             cwd="/test",
         )
 
-        with patch("subprocess.run") as mock_run:
-            zunda_speaker.handle_event(event)
+        zunda_speaker.handle_event(event)
 
-            mock_run.assert_called_once()
-            args = mock_run.call_args[0][0]
-            assert args[2] == str(ZundaspeakStyle.SEXY.value)  # Should use SEXY style
-            assert "終わった" in args[3]
+        mock_popen.assert_called_once()
+        args = mock_popen.call_args[0][0]
+        assert args[2] == str(ZundaspeakStyle.SEXY.value)  # Should use SEXY style
+        assert "終わった" in args[3]
 
-    def test_speak_exception_handling(self, zunda_speaker):
+    def test_handle_enum_event_name(self, mock_popen, zunda_speaker):
+        """Test that events named by HookEventName members are dispatched"""
+        event = HookEvent(
+            hook_event_name=HookEventName.STOP,
+            session_id="test-session",
+            cwd="/test",
+        )
+
+        zunda_speaker.handle_event(event)
+
+        mock_popen.assert_called_once()
+        assert "終わった" in mock_popen.call_args[0][0][3]
+
+    def test_speak_exception_handling(self, mock_popen, zunda_speaker):
         """Test that exceptions are handled gracefully"""
-        with patch("subprocess.run") as mock_run:
-            mock_run.side_effect = Exception("Command not found")
+        mock_popen.side_effect = Exception("Command not found")
 
-            # Should not raise
-            zunda_speaker._speak("Test message")
+        # Should not raise
+        zunda_speaker._speak("Test message")
 
-    def test_command_simplification(self, zunda_speaker):
+    def test_speak_does_not_wait(self, mock_popen, zunda_speaker):
+        """Test that zundaspeak is started detached from our pipes"""
+        zunda_speaker._speak("Test message")
+
+        mock_popen.assert_called_once()
+        kwargs = mock_popen.call_args.kwargs
+        assert kwargs["stdin"] == subprocess.DEVNULL
+        assert kwargs["stdout"] == subprocess.DEVNULL
+        assert kwargs["stderr"] == subprocess.DEVNULL
+        assert kwargs["start_new_session"] is True
+        mock_popen.return_value.wait.assert_not_called()
+        mock_popen.return_value.communicate.assert_not_called()
+
+    def test_command_simplification(self, mock_popen, zunda_speaker):
         """Test command simplification"""
         event = HookEvent(
             hook_event_name="PreToolUse",
@@ -215,17 +258,16 @@ class TestZundaSpeaker:
             },
         )
 
-        with patch("subprocess.run") as mock_run:
-            zunda_speaker.handle_event(event)
+        zunda_speaker.handle_event(event)
 
-            args = mock_run.call_args[0][0]
-            message = args[3]
-            assert "git" in message
-            assert "commit" in message
-            # Long commit message should be simplified
-            assert "Fix issue #123" not in message
+        args = mock_popen.call_args[0][0]
+        message = args[3]
+        assert "git" in message
+        assert "commit" in message
+        # Long commit message should be simplified
+        assert "Fix issue #123" not in message
 
-    def test_skip_file_operations(self, zunda_speaker):
+    def test_skip_file_operations(self, mock_popen, zunda_speaker):
         """Test that file operations are skipped"""
         file_tools = ["Write", "Edit", "MultiEdit", "Read"]
 
@@ -238,11 +280,10 @@ class TestZundaSpeaker:
                 tool_input={"file_path": "/test/file.py"},
             )
 
-            with patch("subprocess.run") as mock_run:
-                zunda_speaker.handle_event(event)
-                mock_run.assert_not_called()
+            zunda_speaker.handle_event(event)
+            mock_popen.assert_not_called()
 
-    def test_different_events_ignored(self, zunda_speaker):
+    def test_different_events_ignored(self, mock_popen, zunda_speaker):
         """Test that irrelevant events are ignored"""
         event = HookEvent(
             hook_event_name="PostToolUse",
@@ -252,9 +293,8 @@ class TestZundaSpeaker:
             result={"output": "Success"},
         )
 
-        with patch("subprocess.run") as mock_run:
-            zunda_speaker.handle_event(event)
-            mock_run.assert_not_called()
+        zunda_speaker.handle_event(event)
+        mock_popen.assert_not_called()
 
     def test_disabled_via_env(self):
         """Test that speaker can be disabled via environment"""
@@ -267,7 +307,7 @@ class TestZundaSpeaker:
                 speaker = ZundaSpeaker()
                 assert not speaker.enabled
 
-    def test_handle_pre_compact(self, zunda_speaker):
+    def test_handle_pre_compact(self, mock_popen, zunda_speaker):
         """Test handling of PreCompact event"""
         event = HookEvent(
             hook_event_name="PreCompact",
@@ -275,15 +315,14 @@ class TestZundaSpeaker:
             cwd="/test",
         )
 
-        with patch("subprocess.run") as mock_run:
-            zunda_speaker.handle_event(event)
+        zunda_speaker.handle_event(event)
 
-            mock_run.assert_called_once()
-            args = mock_run.call_args[0][0]
-            assert "コンテキストが長くなってきたのだ" in args[3]
-            assert "新しいセッション" in args[3]
+        mock_popen.assert_called_once()
+        args = mock_popen.call_args[0][0]
+        assert "コンテキストが長くなってきたのだ" in args[3]
+        assert "新しいセッション" in args[3]
 
-    def test_git_commands_formatting(self, zunda_speaker):
+    def test_git_commands_formatting(self, mock_popen, zunda_speaker):
         """Test various git commands are formatted correctly"""
         git_commands = [
             ("git status", "git status"),
@@ -301,17 +340,17 @@ class TestZundaSpeaker:
                 tool_input={"command": cmd},
             )
 
-            with patch("subprocess.run") as mock_run:
-                zunda_speaker.handle_event(event)
+            mock_popen.reset_mock()
+            zunda_speaker.handle_event(event)
 
-                if mock_run.call_count > 0:
-                    args = mock_run.call_args[0][0]
-                    message = args[3]
-                    assert expected_phrase in message, (
-                        f"Expected '{expected_phrase}' in '{message}'"
-                    )
+            if mock_popen.call_count > 0:
+                args = mock_popen.call_args[0][0]
+                message = args[3]
+                assert expected_phrase in message, (
+                    f"Expected '{expected_phrase}' in '{message}'"
+                )
 
-    def test_uv_commands_formatting(self, zunda_speaker):
+    def test_uv_commands_formatting(self, mock_popen, zunda_speaker):
         """Test various uv commands are formatted correctly"""
         uv_commands = [
             ("uv run task test", "uv run task test"),
@@ -332,15 +371,15 @@ class TestZundaSpeaker:
                 tool_input={"command": command},
             )
 
-            with patch("subprocess.run") as mock_run:
-                zunda_speaker.handle_event(event)
-                mock_run.assert_called_once()
-                args = mock_run.call_args[0][0]
-                message = args[3]
-                # Check that the formatted command contains expected text
-                assert expected_formatted in message, (
-                    f"Expected '{expected_formatted}' in '{message}'"
-                )
+            mock_popen.reset_mock()
+            zunda_speaker.handle_event(event)
+            mock_popen.assert_called_once()
+            args = mock_popen.call_args[0][0]
+            message = args[3]
+            # Check that the formatted command contains expected text
+            assert expected_formatted in message, (
+                f"Expected '{expected_formatted}' in '{message}'"
+            )
 
     def test_message_sanitization_security(self, zunda_speaker):
         """Test message sanitization against command injection"""
@@ -376,36 +415,34 @@ class TestZundaSpeaker:
         sanitized = zunda_speaker._sanitize_message(messy_whitespace)
         assert sanitized == "hello world"
 
-    def test_sanitization_applied_to_speech(self, zunda_speaker):
+    def test_sanitization_applied_to_speech(self, mock_popen, zunda_speaker):
         """Test that sanitization is applied when speaking"""
         dangerous_message = "safe text; rm -rf /"
 
-        with patch("subprocess.run") as mock_run:
-            zunda_speaker._speak(dangerous_message)
+        zunda_speaker._speak(dangerous_message)
 
-            mock_run.assert_called_once()
-            args = mock_run.call_args[0][0]
-            # Verify the message argument (4th position) is sanitized
-            actual_message = args[3]
-            assert ";" not in actual_message  # Dangerous ; should be removed
-            assert "rm" in actual_message  # Safe letters should remain
-            assert actual_message == "safe text rm -rf /"
+        mock_popen.assert_called_once()
+        args = mock_popen.call_args[0][0]
+        # Verify the message argument (4th position) is sanitized
+        actual_message = args[3]
+        assert ";" not in actual_message  # Dangerous ; should be removed
+        assert "rm" in actual_message  # Safe letters should remain
+        assert actual_message == "safe text rm -rf /"
 
-    def test_empty_or_invalid_messages(self, zunda_speaker):
+    def test_empty_or_invalid_messages(self, mock_popen, zunda_speaker):
         """Test handling of empty or invalid messages"""
-        with patch("subprocess.run") as mock_run:
-            # Empty message should not call subprocess
-            zunda_speaker._speak("")
-            mock_run.assert_not_called()
-
-            # Message that becomes empty after sanitization
-            zunda_speaker._speak("\x00\x01\x02")
-            mock_run.assert_not_called()
-
-            # Reset mock for valid message test
-            mock_run.reset_mock()
-            zunda_speaker._speak("valid message")
-            mock_run.assert_called_once()
+        # Empty message should not call subprocess
+        zunda_speaker._speak("")
+        mock_popen.assert_not_called()
+
+        # Message that becomes empty after sanitization
+        zunda_speaker._speak("\x00\x01\x02")
+        mock_popen.assert_not_called()
+
+        # Reset mock for valid message test
+        mock_popen.reset_mock()
+        zunda_speaker._speak("valid message")
+        mock_popen.assert_called_once()
 
     def test_command_readability_preserved(self, zunda_speaker):
         """Test that common command patterns remain readable after sanitization"""